@@ -2,11 +2,11 @@
 import csv
 import os
 import sys
-import time
 
 from argparse import Namespace
-from collections import defaultdict
-from typing import Any, Dict, List
+from collections import Counter
+from multiprocessing.pool import ThreadPool
+from typing import Any, Dict, Iterator, List, Set, Tuple
 
 import rapidjson
 
@@ -19,6 +19,7 @@ from fusion_report.common.exceptions.download import DownloadException
 from fusion_report.common.fusion_manager import FusionManager
 from fusion_report.common.logger import Logger
 from fusion_report.common.models.fusion import Fusion
+from fusion_report.common.page import Page
 from fusion_report.common.report import Report
 from fusion_report.data.cosmic import CosmicDB
 from fusion_report.data.fusiongdb import FusionGDB
@@ -58,6 +59,7 @@ class App:
         try:
             if params.command == 'run':
                 Logger(__name__).info('Running application...')
+                self.validate(params)
                 self.preprocess(params)
                 self.generate_report(params)
                 self.export_results(params.output, params.export)
@@ -77,6 +79,28 @@ class App:
         except (AppException, DbException, DownloadException, IOError) as ex:
             raise AppException(ex)
 
+    def validate(self, params: Namespace) -> None:
+        """Method validating required input before any processing. At least one fusion detection
+        tool output has to be provided and all provided outputs and local databases have to exist.
+
+        Raises:
+            AppException
+        """
+        tool_outputs: Dict[str, str] = {
+            tool: getattr(params, tool) for tool in self.manager.supported_tools
+            if getattr(params, tool, None)
+        }
+        if not tool_outputs:
+            raise AppException('No fusion detection tool output provided')
+
+        for tool, output in tool_outputs.items():
+            if not os.path.isfile(output):
+                raise AppException(f'Output {output} of tool {tool} not found')
+
+        for database in [Settings.COSMIC, Settings.MITELMAN, Settings.FUSIONGDB, Settings.FUSIONGDB2]:
+            if not os.path.isfile(os.path.join(params.db_path, f'{database["NAME"].lower()}.db')):
+                raise AppException(f'Database {database["NAME"]} not found in {params.db_path}')
+
     def preprocess(self, params: Namespace) -> None:
         """Parse, enrich and score fusion."""
         self.parse_fusion_outputs(vars(params))
@@ -96,37 +120,50 @@ class App:
         )
         report.render(index_page)
 
-        with tqdm(total=len(fusions)) as pbar:
-            for fusion in fusions:
-                fusion_page = report.create_page(
-                    fusion.name, page_variables={'sample': params.sample}
-                )
-                fusion_page.add_module('fusion_summary', params={'fusion': fusion})
-                fusion_page.add_module(
-                    'fusiongdb.variations',
-                    params={'fusion': fusion.name, 'db_path': params.db_path}
-                )
-                fusion_page.add_module(
-                    'fusiongdb.transcripts',
-                    params={'fusion': fusion.name, 'db_path': params.db_path}
-                )
-                fusion_page.add_module(
-                    'fusiongdb.ppi',
-                    params={'fusion': fusion.name, 'db_path': params.db_path}
-                )
-                fusion_page.add_module(
-                    'fusiongdb.drugs',
-                    params={'fusion': fusion.name, 'db_path': params.db_path}
-                )
-                fusion_page.add_module(
-                    'fusiongdb.diseases',
-                    params={'fusion': fusion.name, 'db_path': params.db_path}
-                )
-                report.render(fusion_page)
-                pbar.set_description(f'Processing {fusion.name}')
-                time.sleep(0.1)
+        # fetch FusionGDB details of all fusions at once instead of querying per page
+        fusion_pairs: List[Tuple[str, ...]] = [fusion.genes for fusion in fusions if len(fusion.genes) == 2]
+        fusiongdb = FusionGDB(params.db_path)
+        fusiongdb_details: Dict[str, Dict[Tuple[str, ...], List[Any]]] = {
+            'variations': fusiongdb.get_variations(fusion_pairs),
+            'transcripts': fusiongdb.get_transcripts(fusion_pairs),
+            'ppi': fusiongdb.get_ppi(fusion_pairs),
+            'drugs': fusiongdb.get_drugs(fusion_pairs),
+            'diseases': fusiongdb.get_diseases(fusion_pairs)
+        }
+
+        # pages are created lazily and released as soon as they are rendered
+        fusion_pages: Iterator[Tuple[Page, Fusion]] = (
+            (report.create_page(fusion.name, page_variables={'sample': params.sample}), fusion)
+            for fusion in fusions
+        )
+        with ThreadPool(Settings.THREAD_NUM) as pool, tqdm(total=len(fusions)) as pbar:
+            for fusion_name in pool.imap_unordered(
+                lambda x: self.generate_fusion_page(report, x[0], x[1], fusiongdb_details),
+                fusion_pages
+            ):
+                pbar.set_description(f'Processing {fusion_name}', refresh=False)
                 pbar.update(1)
 
+    @staticmethod
+    def generate_fusion_page(report: Report, page: Page, fusion: Fusion,
+                             fusiongdb_details: Dict[str, Dict[Tuple[str, ...], List[Any]]]) -> str:
+        """Load all modules of a fusion page and render it. FusionGDB sections without any
+        records are left out, so fusions without details get a compact summary page.
+
+        Returns:
+            Name of the rendered fusion
+        """
+        page.add_module('fusion_summary', params={'fusion': fusion})
+        for module, details in fusiongdb_details.items():
+            if details.get(fusion.genes):
+                page.add_module(
+                    f'fusiongdb.{module}',
+                    params={'fusion': fusion.name, 'data': details[fusion.genes]}
+                )
+        report.render(page)
+
+        return fusion.name
+
     def parse_fusion_outputs(self, params: Dict[str, Any]) -> None:
         """Executes parsing for each provided fusion detection tool."""
         for param, value in params.items():
@@ -137,11 +174,12 @@ class App:
 
     def enrich(self, path: str) -> None:
         """Enrich fusion with all relevant information from local databases."""
-        local_fusions: Dict[str, List[str]] = {
-            CosmicDB(path).name: CosmicDB(path).get_all_fusions(),
-            MitelmanDB(path).name: MitelmanDB(path).get_all_fusions(),
-            FusionGDB(path).name: FusionGDB(path).get_all_fusions(),
-            FusionGDB2(path).name: FusionGDB2(path).get_all_fusions()
+        fusions: List[str] = [fusion.name for fusion in self.manager.fusions]
+        local_fusions: Dict[str, Set[str]] = {
+            CosmicDB(path).name: CosmicDB(path).get_known_fusions(fusions),
+            MitelmanDB(path).name: MitelmanDB(path).get_known_fusions(fusions),
+            FusionGDB(path).name: FusionGDB(path).get_known_fusions(fusions),
+            FusionGDB2(path).name: FusionGDB2(path).get_known_fusions(fusions)
         }
         for fusion in self.manager.fusions:
             for db_name, db_list in local_fusions.items():
@@ -240,7 +278,7 @@ class App:
                          sample_name: str, running_tools_count: int) -> None:
         """Helper function that generates MultiQC Fusion section (`fusion_genes_mqc.json`)."""
 
-        counts: Dict[str, int] = defaultdict(lambda: 0)
+        counts: Counter = Counter()
         for fusion in fusions:
             tools = fusion.dbs
             if len(tools) == running_tools_count:
@@ -15,6 +15,8 @@ class BasePage:
         view: View
         modules: Custom modules
     """
+    __slots__ = ('title', 'view', 'modules', 'filename')
+
     def __init__(self, title: str, view: str, filename: str = None) -> None:
         self.title: str = title.strip()
         self.view: str = f'views/{view}.html'
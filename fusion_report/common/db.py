@@ -1,8 +1,9 @@
 """Database wrapper"""
 import os
 import sqlite3
+import threading
 
-from typing import List
+from typing import Any, Dict, List, Sequence, Set, Tuple
 
 from fusion_report.common.exceptions.db import DbException
 from fusion_report.settings import Settings
@@ -15,13 +16,25 @@ class Db:
         name: Database name
         schema: Schema defining database structure (sql file)
         database: Database file *.db
-        connection: Established connection to the database
+        connection: Established connection to the database, shared by all threads
+        lock: Serializes access to the shared connection
+        MAX_VARIABLES: Maximum number of bound parameters in a single statement
+        PRAGMAS: Connection settings tuned for the read-mostly workload of the report
     """
 
+    MAX_VARIABLES: int = 999
+    PRAGMAS: Dict[str, Any] = {
+        'synchronous': 'NORMAL',
+        'temp_store': 'MEMORY',
+        'cache_size': -65536,  # 64 MiB
+        'mmap_size': 268435456  # 256 MiB
+    }
+
     def __init__(self, path: str, name: str, schema: str) -> None:
         self.name: str = name
         self._schema: str = schema
         self.database: str = f'{name.lower()}.db'
+        self.lock = threading.RLock()
         self.connection = self.connect(path, self.database)
 
     def connect(self, path: str, database: str):
@@ -34,8 +47,10 @@ class Db:
             DbException
         """
         try:
-            connection = sqlite3.connect(os.path.join(path, database))
+            connection = sqlite3.connect(os.path.join(path, database), check_same_thread=False)
             connection.row_factory = self.__dict_factory
+            for pragma, value in self.PRAGMAS.items():
+                connection.execute(f'PRAGMA {pragma} = {value}')
             return connection
         except sqlite3.DatabaseError as ex:
             raise DbException(ex)
@@ -89,7 +104,7 @@ class Db:
             DbException
         """
         try:
-            with self.connection as conn:
+            with self.lock, self.connection as conn:
                 cur = conn.cursor()
                 if not params:
                     cur.execute(query)
@@ -101,6 +116,53 @@ class Db:
         except sqlite3.OperationalError as ex:
             raise DbException(ex)
 
+    def select_column(self, query: str, params: List[str] = None) -> List[Any]:
+        """Select values of the first column. Rows are not converted into dictionaries, which
+           makes it suitable for large single column results.
+
+        Raises:
+            DbException
+        """
+        try:
+            with self.lock, self.connection as conn:
+                cur = conn.cursor()
+                cur.row_factory = None
+                if not params:
+                    cur.execute(query)
+                else:
+                    cur.execute(query, params)
+                res = [row[0] for row in cur]
+                cur.close()
+                return res
+        except sqlite3.OperationalError as ex:
+            raise DbException(ex)
+
+    def select_in(self, query: str, values: Sequence[Tuple[str, ...]]):
+        """Select data for many keys at once. The query has to contain a `{values}` placeholder
+           which is replaced by `VALUES (?, ...), (?, ...)` built from unique provided keys, i.e.
+           `WHERE gene IN ({values})` or joined as a table `FROM ({values}) AS keys`. Keys are
+           queried in chunks so the number of bound parameters stays within SQLite limits.
+
+        Raises:
+            DbException
+        """
+        res: List[Any] = []
+        if not values:
+            return res
+
+        values = list(dict.fromkeys(values))
+
+        placeholder: str = f"({', '.join(['?'] * len(values[0]))})"
+        chunk_size: int = max(1, self.MAX_VARIABLES // len(values[0]))
+        for start in range(0, len(values), chunk_size):
+            chunk = values[start:start + chunk_size]
+            res.extend(self.select(
+                query.format(values=f"VALUES {', '.join([placeholder] * len(chunk))}"),
+                [value for key in chunk for value in key]
+            ))
+
+        return res
+
     def execute(self, query: str, params: List[str] = None):
         """Execute SQL statement. Can be anything like INSERT/UPDATE/DELETE ...
 
@@ -108,7 +170,7 @@ class Db:
             DbException
         """
         try:
-            with self.connection as conn:
+            with self.lock, self.connection as conn:
                 cur = conn.cursor()
                 if not params:
                     cur.execute(query)
@@ -118,6 +180,15 @@ class Db:
         except sqlite3.Error as ex:
             raise DbException(ex)
 
+    def get_all_fusions(self) -> List[str]:
+        """Returns all fusions from database in format `GENEA--GENEB`."""
+        raise NotImplementedError(f'{self.name} has to implement get_all_fusions()')
+
+    def get_known_fusions(self, fusions: List[str]) -> Set[str]:
+        """Returns provided fusions which are found in database. Databases can override it
+           to search only for provided fusions instead of loading all of them."""
+        return set(fusions).intersection(self.get_all_fusions())
+
     @property
     def schema(self):
         """Returns database schema."""
@@ -126,7 +197,4 @@ class Db:
     @classmethod
     def __dict_factory(cls, cursor, row):
         """Helper class for converting SQL results into dictionary"""
-        tmp_dictionary = {}
-        for idx, col in enumerate(cursor.description):
-            tmp_dictionary[col[0]] = row[idx]
-        return tmp_dictionary
+        return {col[0]: value for col, value in zip(cursor.description, row)}
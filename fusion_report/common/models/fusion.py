@@ -1,5 +1,5 @@
 """ Fusion Model """
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from fusion_report.common.logger import Logger
 
@@ -9,12 +9,16 @@ class Fusion:
 
     Attributes:
         name: Fusion name
+        genes: Genes of the fusion split from its name, i.e: ('GENEA', 'GENEB')
         score: Fusion score, attributes: `score` and `explained`
         dbs: List of databases where fusion was found
         tools: List of tools which detected fusion
     """
+    __slots__ = ('name', 'genes', '_score', 'dbs', 'tools')
+
     def __init__(self, name: str) -> None:
         self.name: str = name.strip()
+        self.genes: Tuple[str, ...] = tuple(self.name.split('--'))
         self._score: Dict[str, Any] = {'score': 0, 'explained': ''}
         self.dbs: List[str] = []
         self.tools: Dict[str, Any] = {}
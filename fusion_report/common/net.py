@@ -7,7 +7,6 @@ import ssl
 import urllib.error
 import urllib.request
 import time
-import pandas as pd
 from zipfile import ZipFile
 
 
@@ -113,6 +112,9 @@ class Net:
     @staticmethod
     def get_fusiongdb2(self, return_err: List[str]) -> None:
         """Method for download FusionGDB2 database."""
+        # pandas is slow to import and only needed here, importing it lazily keeps CLI start fast
+        import pandas as pd
+
         try:
             url: str = f'{Settings.FUSIONGDB2["HOSTNAME"]}/{Settings.FUSIONGDB2["FILE"]}'
             Net.get_large_file(url)
@@ -1,5 +1,5 @@
 """Report class"""
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
 from fusion_report.common.exceptions.report import ReportException
 from fusion_report.common.page import Page
@@ -7,18 +7,19 @@ from fusion_report.common.template import Template
 
 
 class Report(Template):
-    """Report is the base container containing all types of pages.
+    """Report is the base container containing all types of pages. Pages are written to the
+    output directory when rendered, the report only keeps track of their titles.
 
     Attributes:
-        pages: List of pages
+        pages: Titles of created pages by their filename
     """
     def __init__(self, config_path: str, output_dir: str) -> None:
-        self.pages: List[Page] = []
+        self.pages: Dict[str, str] = {}
         super().__init__(config_path, output_dir)
 
     def create_page(self, title: str, view: str = 'index',
                     filename: str = None, page_variables: Dict[str, Any] = None) -> Page:
-        """Creates and adds page in the list.
+        """Creates page and registers it in the report.
 
         Return:
             page: Page object
@@ -30,27 +31,12 @@ class Report(Template):
             page_variables = {}
 
         page = Page(title, view, filename, page_variables)
-        if self.index_by(filename) != -1:
+        if filename in self.pages:
             raise ReportException(f'Page {page.filename} already exists!')
 
-        self.pages.append(page)
+        self.pages[page.filename] = page.title
         return page
 
-    def get_page(self, filename: str) -> Page:
-        """Search page by its file name.
-
-        Returns:
-            page
-
-        Raises:
-            ReportException
-        """
-        index = self.index_by(filename)
-        if index == -1:
-            raise ReportException(f'Page {filename} not found')
-
-        return self.pages[index]
-
     def render(self, page: Page, extra_variables: Optional[Dict[str, Any]] = None):
         """Method for rendering page using templating engine."""
         template_variables: Dict[str, Any] = page.get_content()
@@ -68,17 +54,3 @@ class Report(Template):
             template_variables = {**template_variables, **extra_variables}
 
         super().render(page, template_variables)
-
-    def index_by(self, value: Optional[str]) -> int:
-        """Find page based on its filename.
-
-        Return:
-            >= 0: page exists
-            -1: page doesn't exist
-        """
-        if value:
-            for index, page in enumerate(self.pages):
-                if page.filename == value:
-                    return index
-
-        return -1
@@ -17,6 +17,7 @@ class Template:
         j2_env: Jinja2 Environment
         j2_variables: Extra variables from configuration
         output_dir: Output directory where the files will be generated
+        raw_files: Cache of raw files included in pages
     """
     def __init__(self, config_path: str, output_dir: str) -> None:
         self.j2_env = Environment(
@@ -25,10 +26,12 @@ class Template:
                 os.path.join(Settings.ROOT_DIR, 'modules/')
             ]),
             trim_blocks=True,
-            autoescape=True
+            autoescape=True,
+            auto_reload=False
         )
         self.j2_variables: Config = Config().parse(config_path)
         self.output_dir: str = output_dir
+        self.raw_files: Dict[str, Markup] = {}
 
         # helper functions which can be used inside partial templates
         self.j2_env.globals['include_raw'] = self.include_raw
@@ -49,7 +52,15 @@ class Template:
 
     def include_raw(self, filename: str) -> Markup:
         """Helper fusion for including raw content in Jinja2, mostly used to include custom
-        or vendor javascript and custom css"""
+        or vendor javascript and custom css. The same assets are included in every page,
+        so each file is read only once."""
+        if filename not in self.raw_files:
+            self.raw_files[filename] = self.__read_raw(filename)
+
+        return self.raw_files[filename]
+
+    def __read_raw(self, filename: str) -> Markup:
+        """Helper reading raw file and wrapping it based on its type."""
         file_extension = Path(filename).suffix
         assert isinstance(self.j2_env.loader, FileSystemLoader)
 
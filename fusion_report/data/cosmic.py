@@ -19,7 +19,7 @@ class CosmicDB(Db, metaclass=Singleton):
         query: str = '''SELECT DISTINCT translocation_name
                         FROM cosmicfusionexport
                         WHERE translocation_name != ""'''
-        res = self.select(query)
+        res = self.select_column(query)
 
-        return ['--'.join(re.findall(r'\(.*?\)', x['translocation_name']))
+        return ['--'.join(re.findall(r'\(.*?\)', x))
                 .replace('(', '').replace(')', '') for x in res]
@@ -1,5 +1,6 @@
 """FusionGDB Database"""
-from typing import List
+from collections import defaultdict
+from typing import Any, Dict, List, Set, Tuple
 
 from fusion_report.common.db import Db
 from fusion_report.common.singleton import Singleton
@@ -24,6 +25,93 @@ class FusionGDB(Db, metaclass=Singleton):
         """Returns all fusions from database."""
         query: str = '''SELECT DISTINCT (h_gene || "--" || t_gene) as fusion_pair
                         FROM tcga_chitars_combined_fusion_information_on_hg19'''
-        res = self.select(query)
 
-        return [fusion['fusion_pair'] for fusion in res]
+        return self.select_column(query)
+
+    def get_known_fusions(self, fusions: List[str]) -> Set[str]:
+        """Returns provided fusions which are found in database."""
+        query: str = '''SELECT DISTINCT h_gene, t_gene FROM ({values}) AS detected
+                        INNER JOIN tcga_chitars_combined_fusion_information_on_hg19
+                        ON h_gene = detected.column1 AND t_gene = detected.column2'''
+        res = self.select_in(
+            query, [tuple(fusion.split('--', 1)) for fusion in fusions if '--' in fusion]
+        )
+
+        return {f"{fusion['h_gene']}--{fusion['t_gene']}" for fusion in res}
+
+    def get_variations(self, fusions: List[Tuple[str, ...]]) -> Dict[Tuple[str, ...], List[Any]]:
+        """Returns fusion gene variations of all provided fusions."""
+        query: str = '''SELECT info.* FROM ({values}) AS fusions
+                        INNER JOIN tcga_chitars_combined_fusion_information_on_hg19 AS info
+                        ON info.h_gene = fusions.column1 AND info.t_gene = fusions.column2'''
+
+        return self.__group_by_fusion(self.select_in(query, fusions))
+
+    def get_transcripts(self, fusions: List[Tuple[str, ...]]) -> Dict[Tuple[str, ...], List[Any]]:
+        """Returns Ensembl transcripts of all provided fusions."""
+        query: str = '''SELECT orf.* FROM ({values}) AS fusions
+                        INNER JOIN tcga_chitars_combined_fusion_ORF_analyzed_gencode_h19v19 AS orf
+                        ON orf.h_gene = fusions.column1 AND orf.t_gene = fusions.column2'''
+
+        return self.__group_by_fusion(self.select_in(query, fusions))
+
+    def get_ppi(self, fusions: List[Tuple[str, ...]]) -> Dict[Tuple[str, ...], List[Any]]:
+        """Returns Protein-Protein interactions of all provided fusions."""
+        query: str = '''SELECT DISTINCT h_gene, h_gene_interactions, t_gene, t_gene_interactions
+                        FROM ({values}) AS fusions INNER JOIN fusion_ppi
+                        ON h_gene = fusions.column1 AND t_gene = fusions.column2'''
+
+        return self.__group_by_fusion(self.select_in(query, fusions))
+
+    def get_drugs(self, fusions: List[Tuple[str, ...]]) -> Dict[Tuple[str, ...], List[Any]]:
+        """Returns drugs targeting either gene of all provided fusions."""
+        query: str = '''SELECT gene_symbol, drug_status, drug_bank_id, drug_name, drug_action,
+                        fusion_uniprot_related_drugs.uniprot_acc FROM fusion_uniprot_related_drugs
+                        INNER JOIN uniprot_gsymbol
+                        ON fusion_uniprot_related_drugs.uniprot_acc = uniprot_gsymbol.uniprot_acc
+                        WHERE gene_symbol IN ({values})'''
+        genes: Dict[str, List[Any]] = defaultdict(list)
+        for row in self.select_in(query, self.__genes(fusions)):
+            genes[row['gene_symbol']].append(row)
+
+        return self.__group_by_genes(fusions, genes)
+
+    def get_diseases(self, fusions: List[Tuple[str, ...]]) -> Dict[Tuple[str, ...], List[Any]]:
+        """Returns diseases related to either gene of all provided fusions."""
+        query: str = '''SELECT * FROM fgene_disease_associations
+                        WHERE gene IN ({values}) AND disease_prob > 0.2001'''
+        genes: Dict[str, List[Any]] = defaultdict(list)
+        for row in self.select_in(query, self.__genes(fusions)):
+            genes[row['gene']].append(row)
+
+        res = self.__group_by_genes(fusions, genes)
+        for rows in res.values():
+            rows.sort(key=lambda x: x['disease_prob'], reverse=True)
+
+        return res
+
+    ################################################################################################
+    #  Helpers
+    @staticmethod
+    def __genes(fusions: List[Tuple[str, ...]]) -> List[Tuple[str]]:
+        """Helper returning unique genes of provided fusions."""
+        return [(gene,) for gene in sorted({gene for fusion in fusions for gene in fusion})]
+
+    @staticmethod
+    def __group_by_fusion(rows: List[Any]) -> Dict[Tuple[str, ...], List[Any]]:
+        """Helper grouping rows by fusion (h_gene, t_gene)."""
+        res: Dict[Tuple[str, ...], List[Any]] = defaultdict(list)
+        for row in rows:
+            res[(row['h_gene'], row['t_gene'])].append(row)
+
+        return res
+
+    @staticmethod
+    def __group_by_genes(fusions: List[Tuple[str, ...]],
+                         genes: Dict[str, List[Any]]) -> Dict[Tuple[str, ...], List[Any]]:
+        """Helper merging rows of both fusion genes (h_gene, t_gene)."""
+        res: Dict[Tuple[str, ...], List[Any]] = {}
+        for fusion in fusions:
+            res[fusion] = [row for gene in dict.fromkeys(fusion) for row in genes.get(gene, [])]
+
+        return res
@@ -1,5 +1,5 @@
 """FusionGDB Database"""
-from typing import List
+from typing import List, Set
 
 from fusion_report.common.db import Db
 from fusion_report.common.singleton import Singleton
@@ -16,6 +16,16 @@ class FusionGDB2(Db, metaclass=Singleton):
         """Returns all fusions from database."""
         query: str = '''SELECT DISTINCT fusions
                         FROM fusiongdb2'''
-        res = self.select(query)
+        res = self.select_column(query)
 
-        return [fusion['fusions'].strip() for fusion in res]
+        return [fusion.strip() for fusion in res]
+
+    def get_known_fusions(self, fusions: List[str]) -> Set[str]:
+        """Returns provided fusions which are found in database."""
+        query: str = '''SELECT detected.column1 AS fusion FROM ({values}) AS detected
+                        WHERE detected.column1 IN (
+                            SELECT TRIM(fusions, char(32, 9, 10, 13)) FROM fusiongdb2
+                        )'''
+        res = self.select_in(query, [(fusion,) for fusion in fusions])
+
+        return {fusion['fusion'] for fusion in res}
@@ -1,5 +1,5 @@
 """Mitelman Database"""
-from typing import List
+from typing import List, Set
 
 from fusion_report.common.db import Db
 from fusion_report.common.singleton import Singleton
@@ -15,6 +15,17 @@ class MitelmanDB(Db, metaclass=Singleton):
     def get_all_fusions(self) -> List[str]:
         """Returns all fusions from database."""
         query: str = 'SELECT DISTINCT geneshort FROM mbca WHERE geneshort LIKE "%::%"'
-        res = self.select(query)
+        res = self.select_column(query)
 
-        return [fusion['geneshort'].strip().replace('::', '--') for fusion in res]
+        return [fusion.strip().replace('::', '--') for fusion in res]
+
+    def get_known_fusions(self, fusions: List[str]) -> Set[str]:
+        """Returns provided fusions which are found in database."""
+        query: str = '''SELECT detected.column1 AS fusion FROM ({values}) AS detected
+                        WHERE detected.column1 IN (
+                            SELECT REPLACE(TRIM(geneshort, char(32, 9, 10, 13)), "::", "--")
+                            FROM mbca WHERE geneshort LIKE "%::%"
+                        )'''
+        res = self.select_in(query, [(fusion,) for fusion in fusions])
+
+        return {fusion['fusion'] for fusion in res}
@@ -12,7 +12,7 @@ CREATE TABLE "TCGA_ChiTaRS_combined_fusion_information_on_hg19" (
 	"t_bp" integer NOT NULL DEFAULT -1,
 	"t_strand" char(1) NOT NULL DEFAULT ''
 );
-CREATE INDEX h_gene_index ON TCGA_ChiTaRS_combined_fusion_information_on_hg19(h_gene);
+CREATE INDEX h_t_gene_index ON TCGA_ChiTaRS_combined_fusion_information_on_hg19(h_gene, t_gene);
 CREATE INDEX t_gene_index ON TCGA_ChiTaRS_combined_fusion_information_on_hg19(t_gene);
 
 CREATE TABLE "TCGA_ChiTaRS_combined_fusion_ORF_analyzed_gencode_h19v19" (
@@ -33,7 +33,7 @@ CREATE TABLE "TCGA_ChiTaRS_combined_fusion_ORF_analyzed_gencode_h19v19" (
     "t_bp" integer NOT NULL DEFAULT -1,
 	"t_strand" char(1) NOT NULL DEFAULT ''
 );
-CREATE INDEX h_gene_orf_index ON TCGA_ChiTaRS_combined_fusion_ORF_analyzed_gencode_h19v19(h_gene);
+CREATE INDEX h_t_gene_orf_index ON TCGA_ChiTaRS_combined_fusion_ORF_analyzed_gencode_h19v19(h_gene, t_gene);
 CREATE INDEX t_gene_orf_index ON TCGA_ChiTaRS_combined_fusion_ORF_analyzed_gencode_h19v19(t_gene);
 
 CREATE TABLE "uniprot_gsymbol" (
@@ -41,6 +41,7 @@ CREATE TABLE "uniprot_gsymbol" (
 	"gene_symbol" varchar(50) NOT NULL DEFAULT ''
 );
 CREATE INDEX uniprot_acc_symbol_index ON uniprot_gsymbol(uniprot_acc);
+CREATE INDEX gene_symbol_index ON uniprot_gsymbol(gene_symbol);
 
 CREATE TABLE "fusion_uniprot_related_drugs" (
 	"drug_status" varchar(255) NOT NULL DEFAULT '',
@@ -58,7 +59,7 @@ CREATE TABLE "fusion_ppi" (
 	"t_gene" varchar(50) NOT NULL DEFAULT '',
 	"t_gene_interactions" TEXT NOT NULL
 );
-CREATE INDEX h_gene_ppi_index ON fusion_ppi(h_gene);
+CREATE INDEX h_t_gene_ppi_index ON fusion_ppi(h_gene, t_gene);
 CREATE INDEX t_gene_ppi_index ON fusion_ppi(t_gene);
 
 CREATE TABLE "fgene_disease_associations" (
@@ -1,7 +1,6 @@
 """Protein-Protein interaction module"""
 from typing import Any, Dict, List
 
-from fusion_report.data.fusiongdb import FusionGDB
 from fusion_report.modules.base_module import BaseModule
 
 
@@ -10,14 +9,7 @@ class CustomModule(BaseModule):
 
     def get_data(self) -> List[Any]:
         """Gathers necessary data."""
-
-        return FusionGDB(self.params['db_path']).select(
-            '''
-            SELECT DISTINCT h_gene, h_gene_interactions, t_gene, t_gene_interactions
-            FROM fusion_ppi WHERE h_gene = ? AND t_gene = ?
-            ''',
-            self.params['fusion'].split('--')
-        )
+        return self.params['data']
 
     def build_graph(self):
         """Helper function that generates Network map of Protein-Protein Interactions using